@@ -30,8 +30,9 @@ def main():
         print(f"\n{'=' * 50}")
         print(f"Gate: {name}")
         print(f"{'=' * 50}")
+        circuit = make_circuit()
         for backend in BACKENDS:
-            collect_results_for_unitary(name, make_circuit(), backend, shots=SHOTS)
+            collect_results_for_unitary(name, circuit, backend, shots=SHOTS)
 
 
 if __name__ == "__main__":
@@ -12,9 +12,11 @@ CLIFFORD_THRESHOLD = 0.99
 
 
 def load_json(path: Path) -> dict | None:
-    if not path.exists():
+    # Open directly rather than stat-then-open; a missing file just means no result yet
+    try:
+        return json.loads(path.read_bytes())
+    except FileNotFoundError:
         return None
-    return json.loads(path.read_text())
 
 
 def collect_entries() -> list[dict]:
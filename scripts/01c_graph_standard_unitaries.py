@@ -126,24 +126,16 @@ def _batched_counts_for_x(raw_data: dict, x_value: list[int]) -> Counter[str]:
     if not isinstance(counts_by_x, dict):
         return Counter()
 
-    for x_key, per_x in counts_by_x.items():
-        try:
-            parsed_x = ast.literal_eval(x_key)
-        except (SyntaxError, ValueError):
-            continue
-        if parsed_x != x_value:
-            continue
-
-        if not isinstance(per_x, dict):
-            return Counter()
-
-        selected: Counter[str] = Counter()
-        for bitstring, count in per_x.items():
-            if isinstance(bitstring, str) and isinstance(count, int):
-                selected[bitstring] += count
-        return selected
+    # Keys are written as json.dumps(list(x)), so look the slice up directly instead of parsing every key
+    per_x = counts_by_x.get(json.dumps(x_value))
+    if not isinstance(per_x, dict):
+        return Counter()
 
-    return Counter()
+    selected: Counter[str] = Counter()
+    for bitstring, count in per_x.items():
+        if isinstance(bitstring, str) and isinstance(count, int):
+            selected[bitstring] += count
+    return selected
 
 
 def _select_shots_dir(unitary: str, shots: str | None) -> Path:
@@ -8,7 +8,7 @@ U_circuit = UNITARIES["cnot"]()
 n = 2
 x = (0, 1, 0, 1)  # Example Weyl operator
 
-qc = get_clifford_tester_circuit(U_circuit, n, x)
+qc = get_clifford_tester_circuit(U_circuit, n, x, barriers=True)
 
 # Decompose custom gates so the drawing shows primitive gates
 qc_decomposed = qc.decompose(reps=2)
@@ -9,18 +9,50 @@ importing this module never requires a QI connection or the
 from __future__ import annotations
 
 from collections.abc import Callable
-from functools import cache
+from functools import cache, partial
 from typing import Any, Literal, get_args
 
 from qiskit import QuantumCircuit
+from qiskit.transpiler import Target
 
 BackendName = Literal["aer_simulator", "qi_tuna_9"]
-_VALID_BACKENDS = set(get_args(BackendName))
+_VALID_BACKENDS: frozenset[str] = frozenset(get_args(BackendName))
+
+# https://www.quantum-inspire.com/kbase/tuna-operational-specifics/
+_TUNA_9_QUBIT_PRIORITIES = (4, 1, 2, 6, 7, 0, 3, 5, 8)
+_DEFAULT_QUBIT_PRIORITIES = tuple(range(100))
+
+
+@cache
+def _aer_instruction_names() -> frozenset[str]:
+    from qiskit_aer import AerSimulator
+
+    return frozenset(AerSimulator().target.operation_names) | {"barrier"}
 
 
 def default_transpilation_function(qc: QuantumCircuit) -> QuantumCircuit:
-    """Decompose custom gates so AerSimulator can execute them."""
-    return qc.decompose(reps=3)
+    """Decompose custom gates so AerSimulator can execute them.
+
+    Only instructions Aer doesn't know natively are expanded, so standard gates
+    and ``unitary`` blocks reach the simulator untouched, and a circuit that is
+    already executable is returned as-is.
+    """
+    supported = _aer_instruction_names()
+    while unsupported := {instruction.operation.name for instruction in qc.data} - supported:
+        decomposed = qc.decompose(gates_to_decompose=list(unsupported))
+        if decomposed == qc:
+            break  # nothing left that decompose() can expand; let Aer report it
+        qc = decomposed
+    return qc
+
+
+@cache
+def _aer_simulator() -> Any:
+    from qiskit_aer import AerSimulator
+
+    # max_parallel_experiments=0 lets Aer spread a multi-circuit run() across all cores
+    # (its default of 1 executes the circuits of a job one after another)
+    return AerSimulator(max_parallel_experiments=0)
 
 
 @cache
@@ -30,21 +62,28 @@ def _qi_provider() -> Any:
     return QIProvider()
 
 
-def _get_qi_backend_and_transpilation_function(
-    backend_name: str,
-) -> tuple[Any, Callable[[QuantumCircuit], QuantumCircuit]]:
-    from qiskit import transpile
+@cache
+def _qi_backend(backend_name: str) -> Any:
+    return _qi_provider().get_backend(backend_name)
 
-    backend = _qi_provider().get_backend(backend_name)
 
+def _qi_qubit_priorities(backend_name: str) -> tuple[int, ...]:
     match backend_name:
         case "Tuna-9":
-            # https://www.quantum-inspire.com/kbase/tuna-operational-specifics/
-            qubit_priorities = [4, 1, 2, 6, 7, 0, 3, 5, 8]
+            return _TUNA_9_QUBIT_PRIORITIES
         case _:
-            qubit_priorities = list(range(100))
+            return _DEFAULT_QUBIT_PRIORITIES
 
-    return backend, lambda qc: transpile(qc, backend=backend, initial_layout=qubit_priorities[: qc.num_qubits])
+
+def _transpile_for_target(target: Target, qubit_priorities: tuple[int, ...], qc: QuantumCircuit) -> QuantumCircuit:
+    """Transpile qc onto target, placing qubits by qubit_priorities.
+
+    Module-level and bound to the backend's Target (rather than a closure over the
+    backend), so it can be pickled to worker processes without them reconnecting to QI.
+    """
+    from qiskit import transpile
+
+    return transpile(qc, target=target, initial_layout=list(qubit_priorities[: qc.num_qubits]))
 
 
 def resolve_backend(
@@ -54,7 +93,7 @@ def resolve_backend(
 
     Unlike the previous ``_resolve_backend``, the transpilation function is
     **never** None — AER gets ``default_transpilation_function`` and QI
-    backends get their own transpile lambda.
+    backends get a picklable ``partial`` of their own transpile function.
 
     Imports are lazy so that importing this module doesn't require QI or Aer.
     """
@@ -62,12 +101,10 @@ def resolve_backend(
         raise ValueError(f"Unknown backend '{name}'. Valid: {', '.join(sorted(_VALID_BACKENDS))}")
 
     if name == "aer_simulator":
-        from qiskit_aer import AerSimulator
-
-        return AerSimulator(), default_transpilation_function, None
+        return _aer_simulator(), default_transpilation_function, None
 
     if name == "qi_tuna_9":
-        backend, transpile_fn = _get_qi_backend_and_transpilation_function("Tuna-9")
-        return backend, transpile_fn, 300
+        backend = _qi_backend("Tuna-9")
+        return backend, partial(_transpile_for_target, backend.target, _qi_qubit_priorities("Tuna-9")), 300
 
     raise ValueError(f"Unhandled backend '{name}'")  # unreachable, keeps type-checkers happy
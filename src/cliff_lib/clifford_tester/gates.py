@@ -1,7 +1,20 @@
+from functools import cache
+
 from qiskit import QuantumCircuit
 from qiskit.circuit import Gate
 
 
+@cache
+def register_layout(n: int) -> tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...]]:
+    """
+    Qubit indices for the two n-qubit registers of a Choi state, built once per n.
+
+    Returns:
+        (A, B, AB) where A = 0..n-1, B = n..2n-1 and AB = 0..2n-1
+    """
+    return tuple(range(n)), tuple(range(n, 2 * n)), tuple(range(2 * n))
+
+
 def get_weyl_operator(a: tuple[int, ...], b: tuple[int, ...]) -> Gate:
     """
     Create a gate implementing Weyl operator P_{a,b}.
@@ -20,18 +33,20 @@ def get_weyl_operator(a: tuple[int, ...], b: tuple[int, ...]) -> Gate:
     assert len(a) == len(b)
 
     qc = QuantumCircuit(len(a))
+    _apply_weyl_operator(qc, a, b)
 
-    # Apply Z gates where a_i = 1
-    for i, ai in enumerate(a):
-        if ai:
-            qc.z(i)
+    return qc.to_gate(label=f"P_{a},{b}")
 
-    # Apply X gates where b_i = 1
-    for i, bi in enumerate(b):
-        if bi:
-            qc.x(i)
 
-    return qc.to_gate(label=f"P_{a},{b}")
+def _apply_weyl_operator(qc: QuantumCircuit, a: tuple[int, ...], b: tuple[int, ...]) -> None:
+    """Append the Z/X gates of P_{a,b} (up to global phase) directly onto qubits 0..n-1 of qc."""
+    # Apply Z gates where a_i = 1, as one broadcast call (Qiskit rejects an empty qubit list)
+    if z_qubits := [i for i, ai in enumerate(a) if ai]:
+        qc.z(z_qubits)
+
+    # Apply X gates where b_i = 1
+    if x_qubits := [i for i, bi in enumerate(b) if bi]:
+        qc.x(x_qubits)
 
 
 def maximally_entangled_state(n: int) -> Gate:
@@ -48,14 +63,20 @@ def maximally_entangled_state(n: int) -> Gate:
         Gate that prepares the maximally entangled state on 2n qubits
     """
     qc = QuantumCircuit(2 * n)
+    A, B, _ = register_layout(n)
 
-    for i in range(n):
-        qc.h(i)
-        qc.cx(i, n + i)
+    # H on every qubit of A, then CNOT from A[i] to B[i] (broadcast pairwise)
+    qc.h(A)
+    qc.cx(A, B)
 
     return qc.to_gate(label="Bell")
 
 
+# The Bell-pair preparation only depends on n, so weyl_choi_state shares one gate across all 4^n Weyl operators.
+# Callers must treat the returned gate as read-only.
+_shared_maximally_entangled_state = cache(maximally_entangled_state)
+
+
 def weyl_choi_state(n: int, x: tuple[int, ...]) -> Gate:
     """
     Create a gate that prepares the Choi state of Weyl operator P_x: |P_x⟩⟩
@@ -76,15 +97,16 @@ def weyl_choi_state(n: int, x: tuple[int, ...]) -> Gate:
     a = x[:n]  # First n bits control Z gates
     b = x[n:]  # Last n bits control X gates
 
+    AB = register_layout(n)[2]
     qc = QuantumCircuit(2 * n)
 
     # Step 1: Prepare maximally entangled state
-    bell = maximally_entangled_state(n)
-    qc.append(bell, range(2 * n))
+    bell = _shared_maximally_entangled_state(n)
+    qc.append(bell, AB)
 
-    # Step 2: Apply P_x to the first register only
-    P_x = get_weyl_operator(a, b)
-    qc.append(P_x, range(n))
+    # Step 2: Apply P_x to the first register only. The Z/X gates go straight into this
+    # circuit rather than through their own wrapped P_x gate, since this runs once per x.
+    _apply_weyl_operator(qc, a, b)
 
     return qc.to_gate(label="|P_x⟩⟩")
 
@@ -114,15 +136,15 @@ def discrete_derivative_circuit(U_circuit: QuantumCircuit, n: int, a_vec: tuple[
     # U†
     qc.compose(U_circuit.inverse(), inplace=True)
 
-    # w(a⃗)† = w(a⃗) (Pauli operators are self-inverse up to phase)
-    w = get_weyl_operator(a, b)
-    qc.append(w, range(n))
+    # w(a⃗)† = w(a⃗) (Pauli operators are self-inverse up to phase). Its Z/X gates go in
+    # directly, so nested derivatives don't pile up wrapped P_{a,b} gates to decompose.
+    _apply_weyl_operator(qc, a, b)
 
     # U
     qc.compose(U_circuit, inplace=True)
 
     # w(a⃗)
-    qc.append(w, range(n))
+    _apply_weyl_operator(qc, a, b)
 
     return qc
 
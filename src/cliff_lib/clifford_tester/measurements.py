@@ -1,7 +1,9 @@
+from collections.abc import Sequence
+
 from qiskit import QuantumCircuit
 
 
-def measure_bell_basis(qc: QuantumCircuit, qubits_A: list[int], qubits_B: list[int], clbits: list[int]) -> None:
+def measure_bell_basis(qc: QuantumCircuit, qubits_A: Sequence[int], qubits_B: Sequence[int], clbits: Sequence[int]) -> None:
     """
     Measure in the Bell basis {|P_y⟩⟩⟨⟨P_y|}_y
 
@@ -22,13 +24,11 @@ def measure_bell_basis(qc: QuantumCircuit, qubits_A: list[int], qubits_B: list[i
     assert len(qubits_B) == n
     assert len(clbits) == 2 * n
 
-    # Undo Bell state preparation: CNOT then H
-    for i in range(n):
-        qc.cx(qubits_A[i], qubits_B[i])
-        qc.h(qubits_A[i])
+    # Undo Bell state preparation: CNOT then H (each call broadcasts pairwise over the registers)
+    qc.cx(qubits_A, qubits_B)
+    qc.h(qubits_A)
 
     # Measure: A register gives 'a' (Z info), B register gives 'b' (X info)
     # Store as y = (a, b) = (A measurement, B measurement)
-    for i in range(n):
-        qc.measure(qubits_A[i], clbits[i])  # a bits (Z info)
-        qc.measure(qubits_B[i], clbits[n + i])  # b bits (X info)
+    qc.measure(qubits_A, clbits[:n])  # a bits (Z info)
+    qc.measure(qubits_B, clbits[n:])  # b bits (X info)
@@ -1,6 +1,9 @@
-from collections import Counter
-from collections.abc import Callable
-from itertools import product
+import multiprocessing
+import os
+import pickle
+from collections import Counter, defaultdict
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -8,8 +11,10 @@ import numpy as np
 from qiskit import QuantumCircuit
 from qiskit.providers import BackendV2
 from qiskit.providers.exceptions import JobTimeoutError
+from qiskit_aer import AerSimulator
 
-from ..jobs import get_job_id, load_job, save_job
+from ..backends import default_transpilation_function
+from ..jobs import get_job_id, load_job, remove_job, save_job
 from ..state import (
     BatchedPlan,
     JobEntry,
@@ -22,7 +27,200 @@ from ..state import (
     save_jobs,
     save_plan,
 )
-from .utils import get_clifford_tester_circuit, get_kth_clifford_tester_circuit
+from .utils import get_clifford_tester_tail, get_clifford_tester_template, get_kth_clifford_tester_circuit, prepend_choi_state
+
+# Below this many circuits, process start-up outweighs the parallel transpile
+_PARALLEL_TRANSPILE_MIN_CIRCUITS = 64
+
+# Set in each transpile worker by _init_transpile_worker
+_worker_transpilation_function: Callable[[QuantumCircuit], QuantumCircuit] | None = None
+
+
+def _worker_count() -> int:
+    return os.cpu_count() or 1
+
+
+def _init_transpile_worker(pickled_transpilation_function: bytes) -> None:
+    global _worker_transpilation_function
+    _worker_transpilation_function = pickle.loads(pickled_transpilation_function)
+
+
+def _transpile_in_worker(qc: QuantumCircuit) -> QuantumCircuit:
+    assert _worker_transpilation_function is not None
+    return _worker_transpilation_function(qc)
+
+
+def _transpile_all(
+    circuits: Sequence[QuantumCircuit],
+    transpilation_function: Callable[[QuantumCircuit], QuantumCircuit],
+) -> list[QuantumCircuit]:
+    """
+    Apply transpilation_function to every circuit, across a process pool when worthwhile.
+
+    The function is unpickled once per worker (by the pool initializer) rather than sent with
+    every task, so a function bound to a backend Target ships that Target once per worker.
+
+    Falls back to a serial loop for small batches, single-core machines, and
+    transpilation functions that can't be pickled (e.g. lambdas).
+    """
+    workers = _worker_count()
+    if len(circuits) < _PARALLEL_TRANSPILE_MIN_CIRCUITS or workers == 1:
+        return [transpilation_function(qc) for qc in circuits]
+
+    try:
+        pickled_transpilation_function = pickle.dumps(transpilation_function)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return [transpilation_function(qc) for qc in circuits]
+
+    chunksize = max(1, len(circuits) // (4 * workers))
+    # Spawn rather than fork: the parent is multi-threaded (qiskit/Aer), and forking it can deadlock the workers
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_transpile_worker,
+        initargs=(pickled_transpilation_function,),
+    ) as pool:
+        return list(pool.map(_transpile_in_worker, circuits, chunksize=chunksize))
+
+
+def _can_use_template(backend: BackendV2, transpilation_function: Callable[[QuantumCircuit], QuantumCircuit]) -> bool:
+    """
+    Whether the tester circuits can be bound from one parameterised template (see _build_circuits).
+
+    Only on a noiseless AerSimulator with the default transpilation function: every bound circuit
+    keeps its 2n Weyl rotations, including the identity ones, which a noise model would charge gate errors for.
+    """
+    return transpilation_function is default_transpilation_function and isinstance(backend, AerSimulator) and backend.options.noise_model is None
+
+
+def _build_circuits(
+    U_circuit: QuantumCircuit,
+    n: int,
+    xs: Sequence[tuple[int, ...]],
+    transpilation_function: Callable[[QuantumCircuit], QuantumCircuit],
+    *,
+    use_template: bool,
+) -> dict[tuple[int, ...], QuantumCircuit]:
+    """Build and transpile the tester circuit for each x in xs."""
+    print(f"       building {len(xs)} circuits...")
+    if use_template:
+        # Decomposing custom gates commutes with binding the Weyl parameters, so transpile once.
+        # Layout-aware transpilers resynthesise the parameterised rotations into extra native
+        # gates that per-x transpilation would optimise away, so they still get one circuit per x.
+        template, weyl_bits = get_clifford_tester_template(U_circuit, n)
+        transpiled = transpilation_function(template)
+        return {x: transpiled.assign_parameters(dict(zip(weyl_bits, x, strict=True))) for x in xs}
+
+    # U^{⊗2} + Bell measurement is the same for every x, so build it once
+    tail = get_clifford_tester_tail(U_circuit, n)
+    return dict(zip(xs, _transpile_all([prepend_choi_state(tail, n, x) for x in xs], transpilation_function), strict=True))
+
+
+def _max_circuits_per_job(backend: BackendV2) -> int | None:
+    """
+    Largest number of circuits a single job may carry on backend, or None if unlimited.
+
+    QI backends report max_circuits as None but reject batch jobs holding more than
+    their backend type's max_jobs_per_batch_job circuits at submission.
+    """
+    limits = [backend.max_circuits]
+    if (get_backend_type := getattr(backend, "get_backend_type", None)) is not None:
+        limits.append(get_backend_type().max_jobs_per_batch_job)
+    return min((limit for limit in limits if limit is not None), default=None)
+
+
+def _counts_at(result: Any, circuit_index: int | None) -> dict[str, int]:
+    return result.get_counts() if circuit_index is None else result.get_counts(circuit_index)
+
+
+def _collect_counts_in_batches(
+    shots_by_x: dict[tuple[int, ...], int],
+    build_circuits: Callable[[list[tuple[int, ...]]], dict[tuple[int, ...], QuantumCircuit]],
+    *,
+    backend: BackendV2,
+    jobs_state: JobsState,
+    checkpoint_dir: Path,
+    timeout: float | None,
+) -> None:
+    """
+    Fill in counts for every x in shots_by_x, submitting one multi-circuit job per distinct shot count.
+
+    Circuits are only built (via build_circuits) for the x still missing counts once any
+    jobs saved by an interrupted run have been retrieved.
+
+    Groups larger than the backend accepts in one job (see _max_circuits_per_job) are
+    split across several jobs.
+
+    Each x's JobEntry records the job it went out in and its circuit's position within that job,
+    so an interrupted run can retrieve the whole batch again from the saved job file.
+    """
+    # Look each x up once; entries are then updated in place
+    entries = {x: jobs_state.get_entry(x) for x in shots_by_x}
+
+    # Retrieve jobs submitted by an earlier, interrupted run
+    entries_by_job: dict[str, list[JobEntry]] = defaultdict(list)
+    for entry in entries.values():
+        if entry is not None and entry.counts is None and entry.job_id:
+            entries_by_job[entry.job_id].append(entry)
+
+    for job_id, job_entries in entries_by_job.items():
+        saved_job = load_job(backend, checkpoint_dir, job_id)
+        if saved_job is None:
+            continue
+        print(f"       job {job_id} ({len(job_entries)} circuits): loaded saved job, retrieving...")
+        try:
+            result = saved_job.result(timeout=timeout)
+        except JobTimeoutError:
+            print(f"       job {job_id}: timed out, exiting (job still running)")
+            raise
+        except Exception as e:
+            print(f"       job {job_id}: retrieval failed ({e}), resubmitting")
+            continue
+        for entry in job_entries:
+            entry.counts = _counts_at(result, entry.circuit_index)
+        save_jobs(jobs_state, checkpoint_dir)
+        remove_job(checkpoint_dir, job_id)
+        print(f"       job {job_id}: retrieved")
+
+    # Submit everything still missing, grouped by shot count. All jobs are dispatched before
+    # waiting on any of them, so they queue and run on the backend concurrently.
+    pending = [x for x, entry in entries.items() if entry is None or entry.counts is None]
+    if not pending:
+        return
+    circuits = build_circuits(pending)
+
+    xs_by_shots: dict[int, list[tuple[int, ...]]] = defaultdict(list)
+    for x in pending:
+        xs_by_shots[shots_by_x[x]].append(x)
+
+    max_per_job = _max_circuits_per_job(backend)
+    batches: list[tuple[int, list[tuple[int, ...]]]] = []
+    for shots, xs in xs_by_shots.items():
+        step = max_per_job or len(xs)
+        batches.extend((shots, xs[i : i + step]) for i in range(0, len(xs), step))
+
+    submitted: list[tuple[str, list[JobEntry], Any]] = []
+    for batch_idx, (shots, xs) in enumerate(batches, 1):
+        print(f"       [{batch_idx}/{len(batches)}] submitting {len(xs)} circuits ({shots} shots each)...")
+        job = backend.run([circuits[x] for x in xs], shots=shots)
+        jid = get_job_id(job)
+        job_entries = [JobEntry(job_id=jid, circuit_index=i) for i in range(len(xs))]
+        for x, entry in zip(xs, job_entries, strict=True):
+            jobs_state.set_entry(x, entry)
+        save_job(job, checkpoint_dir)
+        save_jobs(jobs_state, checkpoint_dir)
+        submitted.append((jid, job_entries, job))
+
+    for batch_idx, (jid, job_entries, job) in enumerate(submitted, 1):
+        # get_counts() with no index returns every experiment's counts in one pass (a bare dict for a single circuit)
+        all_counts = job.result(timeout=timeout).get_counts()
+        if not isinstance(all_counts, list):
+            all_counts = [all_counts]
+        for entry, counts in zip(job_entries, all_counts, strict=True):
+            entry.counts = counts
+        save_jobs(jobs_state, checkpoint_dir)
+        remove_job(checkpoint_dir, jid)
+        print(f"       [{batch_idx}/{len(submitted)}] done (id={jid})")
 
 
 def clifford_tester_batched(
@@ -47,7 +245,9 @@ def clifford_tester_batched(
         :param n: Number of qubits U acts on
         :param shots: Number of backend shots per Weyl operator circuit
         :param backend: Qiskit backend to run on
-        :param transpilation_function: Function to transpile circuits before execution
+        :param transpilation_function: Function to transpile circuits before execution. With
+            default_transpilation_function on a noiseless AerSimulator, one parameterised template is
+            transpiled and bound per Weyl operator; otherwise each circuit is transpiled separately
         :param timeout: (optional) number of seconds to wait for a job before exiting
         :param checkpoint_dir: Directory for checkpoint files (plan.json, jobs.json)
 
@@ -61,18 +261,12 @@ def clifford_tester_batched(
         all_x = plan.to_tuples()
         print(f"       loaded existing plan ({len(all_x)} Weyl operators)")
     else:
-        all_x = list(product([0, 1], repeat=2 * n))
-        plan = BatchedPlan(n=n, shots_per_x=shots, all_x=[list(x) for x in all_x])
+        plan = BatchedPlan(n=n, shots_per_x=shots)
+        all_x = plan.to_tuples()
         save_plan(plan, checkpoint_dir)
         print(f"       created new plan ({len(all_x)} Weyl operators, {shots} shots each)")
 
-    # Phase 2: Build & transpile one circuit per Weyl operator
-    print(f"       building {len(all_x)} circuits...")
-    circuits: dict[tuple[int, ...], QuantumCircuit] = {}
-    for x in all_x:
-        circuits[x] = transpilation_function(get_clifford_tester_circuit(U_circuit, n, x))
-
-    # Phase 3: Load existing jobs state
+    # Phase 2: Load existing jobs state
     jobs_state = load_jobs(checkpoint_dir)
     if jobs_state is not None:
         already_done = sum(1 for k in jobs_state.jobs if jobs_state.jobs[k].counts is not None)
@@ -80,42 +274,18 @@ def clifford_tester_batched(
     else:
         jobs_state = JobsState()
 
-    # Phase 4: For each x, collect results (skip/retrieve/submit as needed)
-    for idx, x in enumerate(all_x, 1):
-        if (entry := jobs_state.get_entry(x)) is not None:
-            if entry.counts is not None:
-                continue
-
-            if entry.job_id:
-                saved_job = load_job(backend, checkpoint_dir, entry.job_id)
-                if saved_job is not None:
-                    jid = get_job_id(saved_job)
-                    print(f"       [{idx}/{len(all_x)}] x={list(x)}: loaded saved job (id={jid}), retrieving...")
-                    try:
-                        counts = saved_job.result(timeout=timeout).get_counts()
-                        jobs_state.set_entry(x, JobEntry(job_id=entry.job_id, counts=counts))
-                        save_jobs(jobs_state, checkpoint_dir)
-                        print(f"       [{idx}/{len(all_x)}] x={list(x)}: retrieved")
-                        continue
-                    except JobTimeoutError:
-                        print(f"       [{idx}/{len(all_x)}] x={list(x)}: timed out, exiting (job still running)")
-                        raise
-                    except Exception as e:
-                        print(f"       [{idx}/{len(all_x)}] x={list(x)}: retrieval failed ({e}), resubmitting")
-
-        print(f"       [{idx}/{len(all_x)}] x={list(x)}: submitting ({shots} shots)...")
-        job = backend.run(circuits[x], shots=shots)
-        jid = get_job_id(job)
-        jobs_state.set_entry(x, JobEntry(job_id=jid))
-        save_job(job, checkpoint_dir)
-        save_jobs(jobs_state, checkpoint_dir)
-
-        counts = job.result(timeout=timeout).get_counts()
-        jobs_state.set_entry(x, JobEntry(job_id=jid, counts=counts))
-        save_jobs(jobs_state, checkpoint_dir)
-        print(f"       [{idx}/{len(all_x)}] x={list(x)}: done (id={jid})")
-
-    # Phase 5: Collect raw counts
+    # Phase 3: Collect results, building circuits only for Weyl operators that still need counts
+    # and submitting them together in as few jobs as the backend allows
+    _collect_counts_in_batches(
+        dict.fromkeys(all_x, plan.shots_per_x),
+        lambda xs: _build_circuits(U_circuit, n, xs, transpilation_function, use_template=_can_use_template(backend, transpilation_function)),
+        backend=backend,
+        jobs_state=jobs_state,
+        checkpoint_dir=checkpoint_dir,
+        timeout=timeout,
+    )
+
+    # Phase 4: Collect raw counts
     raw_results = {}
     for x in all_x:
         entry = jobs_state.get_entry(x)
@@ -123,7 +293,7 @@ def clifford_tester_batched(
             raise RuntimeError(f"Missing counts for x={list(x)} after job collection phase")
         raw_results[x] = entry.counts
 
-    # Phase 6: Clean up checkpoint files
+    # Phase 5: Clean up checkpoint files
     cleanup_checkpoint(checkpoint_dir)
     print("       checkpoint cleaned up")
 
@@ -153,32 +323,29 @@ def clifford_tester_paired_runs(
         n: Number of qubits U acts on
         shots: Number of times to run the test
         backend: Qiskit backend to run on (defaults to AerSimulator)
-        transpilation_function: Function to transpile circuits before execution
+        transpilation_function: Function to transpile circuits before execution. With
+            default_transpilation_function on a noiseless AerSimulator, one parameterised template is
+            transpiled and bound per x; otherwise each circuit is transpiled separately
         checkpoint_dir: Directory for checkpoint files (plan.json, jobs.json)
 
     Returns:
         list of dicts, each with keys "x", "y1", "y2"
     """
 
+    rng = np.random.default_rng()
+
     # Phase 1: Load or generate plan
     plan = load_paired_plan(checkpoint_dir)
     if plan is not None:
         x_counts = plan.to_counter()
         print(f"       loaded existing plan ({len(x_counts)} unique x, {sum(x_counts.values())} total shots)")
     else:
-        xs = [tuple(int(v) for v in np.random.randint(0, 2, size=2 * n)) for _ in range(shots)]
-        x_counts = Counter(xs)
+        xs = rng.integers(0, 2, size=(shots, 2 * n), dtype=np.uint8)
+        x_counts = Counter(map(tuple, xs.tolist()))
         save_plan(PairedPlan.from_counter(n, shots, x_counts), checkpoint_dir)
         print(f"       created new plan ({len(x_counts)} unique x, {shots} total shots)")
 
-    # Phase 2: Build & transpile one circuit per unique x
-    print(f"       building {len(x_counts)} circuits...")
-    circuits: dict[tuple[int, ...], QuantumCircuit] = {}
-    for x in x_counts:
-        qc = get_clifford_tester_circuit(U_circuit, n, x)
-        circuits[x] = transpilation_function(qc)
-
-    # Phase 3: Load existing jobs state
+    # Phase 2: Load existing jobs state
     jobs_state = load_jobs(checkpoint_dir)
     if jobs_state is not None:
         already_done = sum(1 for k in jobs_state.jobs if jobs_state.jobs[k].counts is not None)
@@ -186,45 +353,18 @@ def clifford_tester_paired_runs(
     else:
         jobs_state = JobsState()
 
-    # Phase 4: For each x, collect results (skip/retrieve/submit as needed)
-    for idx, (x, count) in enumerate(x_counts.items(), 1):
-        if (entry := jobs_state.get_entry(x)) is not None:
-            # Already have counts — skip
-            if entry.counts is not None:
-                continue
-
-            # Have a saved job file — try to retrieve result
-            if entry.job_id:
-                saved_job = load_job(backend, checkpoint_dir, entry.job_id)
-                if saved_job is not None:
-                    jid = get_job_id(saved_job)
-                    print(f"       [{idx}/{len(x_counts)}] x={list(x)}: loaded saved job (id={jid}), retrieving...")
-                    try:
-                        counts = saved_job.result(timeout=timeout).get_counts()
-                        jobs_state.set_entry(x, JobEntry(job_id=entry.job_id, counts=counts))
-                        save_jobs(jobs_state, checkpoint_dir)
-                        print(f"       [{idx}/{len(x_counts)}] x={list(x)}: retrieved")
-                        continue
-                    except JobTimeoutError:
-                        print(f"       [{idx}/{len(x_counts)}] x={list(x)}: timed out, exiting (job still running)")
-                        raise
-                    except Exception as e:
-                        print(f"       [{idx}/{len(x_counts)}] x={list(x)}: retrieval failed ({e}), resubmitting")
-
-        # Submit new job
-        print(f"       [{idx}/{len(x_counts)}] x={list(x)}: submitting ({2 * count} shots)...")
-        job = backend.run(circuits[x], shots=2 * count)
-        jid = get_job_id(job)
-        jobs_state.set_entry(x, JobEntry(job_id=jid))
-        save_job(job, checkpoint_dir)
-        save_jobs(jobs_state, checkpoint_dir)
-
-        counts = job.result(timeout=timeout).get_counts()
-        jobs_state.set_entry(x, JobEntry(job_id=jid, counts=counts))
-        save_jobs(jobs_state, checkpoint_dir)
-        print(f"       [{idx}/{len(x_counts)}] x={list(x)}: done (id={jid})")
-
-    # Phase 5: Expand counts → shuffle → pair
+    # Phase 3: Collect results, building circuits only for x that still need counts
+    # and submitting every pending x with the same shot count together, split to the backend's job size limit
+    _collect_counts_in_batches(
+        {x: 2 * count for x, count in x_counts.items()},
+        lambda xs: _build_circuits(U_circuit, n, xs, transpilation_function, use_template=_can_use_template(backend, transpilation_function)),
+        backend=backend,
+        jobs_state=jobs_state,
+        checkpoint_dir=checkpoint_dir,
+        timeout=timeout,
+    )
+
+    # Phase 4: Expand counts → shuffle → pair
     raw_results: list[dict[str, Any]] = []
     for x, _ in x_counts.items():
         entry = jobs_state.get_entry(x)
@@ -232,15 +372,17 @@ def clifford_tester_paired_runs(
             raise RuntimeError(f"Missing counts for x={list(x)} after job collection phase")
         counts = entry.counts
 
-        outcomes: list[str] = []
-        for bitstring, freq in counts.items():
-            outcomes.extend([bitstring] * freq)
-        np.random.shuffle(outcomes)
+        # Shuffle indices into the unique bitstrings rather than a list of repeated strings
+        bitstrings = np.array(list(counts))
+        freqs = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+        outcome_idx = np.repeat(np.arange(len(counts)), freqs)
+        rng.shuffle(outcome_idx)
 
-        for i in range(0, len(outcomes) - 1, 2):
-            raw_results.append({"x": x, "y1": outcomes[i], "y2": outcomes[i + 1]})
+        num_pairs = len(outcome_idx) // 2
+        pairs = bitstrings[outcome_idx[: 2 * num_pairs]].reshape(num_pairs, 2).tolist()
+        raw_results.extend({"x": x, "y1": y1, "y2": y2} for y1, y2 in pairs)
 
-    # Phase 6: Clean up checkpoint files
+    # Phase 5: Clean up checkpoint files
     cleanup_checkpoint(checkpoint_dir)
     print("       checkpoint cleaned up")
 
@@ -279,11 +421,14 @@ def kth_clifford_tester(
     Returns:
         Average acceptance rate (probability of ancilla measuring 0)
     """
+    rng = np.random.default_rng()
     rates = []
     # k=2 has 0 a_vectors, so only 1 sample needed
     n_samples = num_a_samples if k > 2 else 1
-    for _ in range(n_samples):
-        a_vectors = [tuple(np.random.randint(0, 2, size=2 * n)) for _ in range(k - 2)]
+    # Draw every direction vector for every sample in one call
+    all_a_bits = rng.integers(0, 2, size=(n_samples, k - 2, 2 * n), dtype=np.uint8).tolist()
+    for a_bits in all_a_bits:
+        a_vectors = [tuple(a_vec) for a_vec in a_bits]
         qc = get_kth_clifford_tester_circuit(U_circuit, n, k, a_vectors)
         qc_transpiled = transpilation_function(qc)
         result = backend.run(qc_transpiled, shots=shots).result()
@@ -1,15 +1,94 @@
+from collections.abc import Sequence
+
+import numpy as np
 from qiskit import QuantumCircuit
+from qiskit.circuit import ParameterVector
 
 from .gates import (
     convolution_3_gate,
     kth_discrete_derivative_circuit,
     maximally_entangled_state,
+    register_layout,
     weyl_choi_state,
 )
 from .measurements import measure_bell_basis
 
 
-def get_clifford_tester_circuit(U_circuit: QuantumCircuit, n: int, x: tuple[int, ...]) -> QuantumCircuit:
+def weyl_x_matrix(n: int) -> np.ndarray:
+    """
+    Enumerate every x in F_2^{2n} as rows of a uint8 bit matrix.
+
+    Row i holds the bits of i, most significant first, so the row order matches
+    ``itertools.product([0, 1], repeat=2 * n)``.
+
+    Args:
+        n: Number of qubits U acts on
+
+    Returns:
+        np.ndarray of shape (4^n, 2n) and dtype uint8
+    """
+    idx = np.arange(4**n, dtype=np.uint64)
+    shifts = np.arange(2 * n, dtype=np.uint64)[::-1]
+    return ((idx[:, None] >> shifts) & 1).astype(np.uint8)
+
+
+def get_clifford_tester_tail(U_circuit: QuantumCircuit, n: int, *, barriers: bool = False) -> QuantumCircuit:
+    """
+    Build the x-independent part of the Clifford tester circuit.
+
+    Applies U^{⊗2} (U to both halves) and then measures in the Bell basis.
+    This is identical for every Weyl operator, so the testers build it once
+    and prepend a different Choi state per x.
+
+    Args:
+        U_circuit: A quantum circuit implementing the n-qubit unitary U
+        n: Number of qubits U acts on
+        barriers: Insert barriers around U^{⊗2} (for drawing; they block transpiler optimisations across stages)
+
+    Returns:
+        QuantumCircuit with 2n qubits and 2n classical bits
+    """
+    qc = QuantumCircuit(2 * n, 2 * n)
+
+    # Qubit layout: qubits 0 to n-1 (A), qubits n to 2n-1 (B)
+    A, B, clbits = register_layout(n)
+
+    if barriers:
+        qc.barrier()
+
+    # Apply U^{⊗2} = U ⊗ U (U to both registers)
+    for qubits in [A, B]:
+        qc.compose(U_circuit, qubits=qubits, inplace=True)
+
+    if barriers:
+        qc.barrier()
+
+    # Measure in Bell basis
+    measure_bell_basis(qc, A, B, clbits)
+
+    return qc
+
+
+def prepend_choi_state(tail: QuantumCircuit, n: int, x: tuple[int, ...]) -> QuantumCircuit:
+    """
+    Prepend the preparation of |P_x⟩⟩ to a circuit built by ``get_clifford_tester_tail``.
+
+    Args:
+        tail: Output of ``get_clifford_tester_tail`` for the unitary under test
+        n: Number of qubits U acts on
+        x: 2n-bit string specifying which Weyl operator to use
+
+    Returns:
+        New QuantumCircuit with 2n qubits and 2n classical bits (``tail`` is not modified)
+    """
+    # Compose the Choi-state block onto the front of the finished tail, instead of
+    # building an empty circuit and composing the whole tail onto it
+    qc = tail.copy()
+    qc.compose(weyl_choi_state(n, x), qubits=qc.qubits, front=True, inplace=True)
+    return qc
+
+
+def get_clifford_tester_circuit(U_circuit: QuantumCircuit, n: int, x: tuple[int, ...], *, barriers: bool = False) -> QuantumCircuit:
     """
     Build the circuit for one sample of the Clifford tester.
 
@@ -18,37 +97,49 @@ def get_clifford_tester_circuit(U_circuit: QuantumCircuit, n: int, x: tuple[int,
     2. Applies U^{⊗2} (U to both halves)
     3. Measures in the Bell basis
 
+    When building circuits for many x, build the tail once with
+    ``get_clifford_tester_tail`` and call ``prepend_choi_state`` per x instead.
+
     Args:
         U_circuit: A quantum circuit implementing the n-qubit unitary U
         n: Number of qubits U acts on
         x: 2n-bit string specifying which Weyl operator to use
+        barriers: Insert barriers between the three stages (for drawing)
 
     Returns:
         QuantumCircuit with 2n qubits and 2n classical bits
     """
-    qc = QuantumCircuit(2 * n, 2 * n)
+    return prepend_choi_state(get_clifford_tester_tail(U_circuit, n, barriers=barriers), n, x)
 
-    # Qubit layout: qubits 0 to n-1 (A), qubits n to 2n-1 (B)
-    A = list(range(n))
-    B = list(range(n, 2 * n))
 
-    # Step 1: Prepare |P_x⟩⟩
-    choi = weyl_choi_state(n, x)
-    qc.append(choi, A + B)
+def get_clifford_tester_template(U_circuit: QuantumCircuit, n: int) -> tuple[QuantumCircuit, ParameterVector]:
+    """
+    Build the Clifford tester circuit with the Weyl operator left as parameters.
 
-    qc.barrier()
+    The Choi state is prepared as Bell pairs followed by RZ(π·x_i) and RX(π·x_{n+i}) on
+    register A. Binding every x_i to 0 or 1 gives |P_x⟩⟩ up to global phase, so one
+    template (transpiled once) stands in for all 4^n circuits.
 
-    # Step 2: Apply U^{⊗2} = U ⊗ U (U to both registers)
-    for qubits in [A, B]:
-        qc.compose(U_circuit, qubits=qubits, inplace=True)
+    Args:
+        U_circuit: A quantum circuit implementing the n-qubit unitary U
+        n: Number of qubits U acts on
 
-    qc.barrier()
+    Returns:
+        (template, weyl_bits) where weyl_bits[i] is the parameter to bind to x_i
+    """
+    weyl_bits = ParameterVector("x", 2 * n)
+    A, _, AB = register_layout(n)
 
-    # Step 3: Measure in Bell basis
-    clbits = list(range(2 * n))
-    measure_bell_basis(qc, A, B, clbits)
+    qc = QuantumCircuit(2 * n, 2 * n)
+    qc.append(maximally_entangled_state(n), AB)
+    # Z^{x_i} then X^{x_{n+i}}, matching the gate order of weyl_choi_state
+    for i in A:
+        qc.rz(np.pi * weyl_bits[i], i)
+    for i in A:
+        qc.rx(np.pi * weyl_bits[n + i], i)
+    qc.compose(get_clifford_tester_tail(U_circuit, n), inplace=True)
 
-    return qc
+    return qc, weyl_bits
 
 
 def get_kth_clifford_tester_circuit(
@@ -141,8 +232,35 @@ def collision_probability(counts: dict[str, int]) -> float:
     This estimates the probability that two independent samples from
     the same distribution would give the same outcome.
     """
-    total = sum(counts.values())
+    total = 0
+    sum_sq = 0
+    # Single pass over the counts; integer sums, then one division at the end
+    for c in counts.values():
+        total += c
+        sum_sq += c * c
     # Protect against DivisionByZero
     if total == 0:
         return 0.0
-    return sum((c / total) ** 2 for c in counts.values())
+    return sum_sq / (total * total)
+
+
+def mean_collision_probability(counts_list: Sequence[dict[str, int]]) -> float:
+    """
+    Average ``collision_probability`` over many counts dicts in one vectorised pass.
+
+    All counts are concatenated into a single array, and per-dict sums are
+    taken with ``np.add.reduceat`` using the offset of each dict.
+    """
+    if not counts_list:
+        return 0.0
+    lengths = np.fromiter((len(counts) for counts in counts_list), dtype=np.int64, count=len(counts_list))
+    if not lengths.all():
+        # reduceat can't express empty segments, fall back to one dict at a time
+        return sum(collision_probability(counts) for counts in counts_list) / len(counts_list)
+    counts_arr = np.fromiter((c for counts in counts_list for c in counts.values()), dtype=np.int64, count=int(lengths.sum()))
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    totals = np.add.reduceat(counts_arr, offsets)
+    squares = np.add.reduceat(counts_arr * counts_arr, offsets)
+    totals_sq = totals * totals
+    per_dict = np.divide(squares, totals_sq, out=np.zeros(len(counts_list)), where=totals_sq != 0)
+    return float(per_dict.mean())
@@ -5,7 +5,7 @@ Based on Lemma 3.6 and Eq. 90 from https://arxiv.org/abs/2510.07164.
 """
 
 import itertools
-from functools import reduce
+from functools import cache, reduce
 
 import numpy as np
 from qiskit import QuantumCircuit
@@ -48,15 +48,41 @@ def pauli_labels_for_n(nn: int) -> list[tuple[int, ...]]:
     return list(itertools.product([0, 1, 2, 3], repeat=nn))
 
 
+# Each single-qubit Pauli has one nonzero per row: row i holds PHASE[i] in column PERM[i]
+PAULI_PERM = np.array([[0, 1], [1, 0], [1, 0], [0, 1]])
+PAULI_PHASE = np.array([[1, 1], [1, 1], [-1j, 1j], [1, -1]])
+
+
+@cache
+def pauli_permutations(nn: int) -> tuple[np.ndarray, np.ndarray]:
+    """Describe every n-qubit Pauli as a (column permutation, phase) pair, each of shape (4^n, 2^n).
+
+    Row i of pauli_n(labels[x]) has its only nonzero entry, phases[x, i], in column perms[x, i].
+    Operators are ordered as in pauli_labels_for_n. The returned arrays are read-only.
+    """
+    perms = np.zeros((1, 1), dtype=np.intp)
+    phases = np.ones((1, 1), dtype=complex)
+    for _ in range(nn):
+        # Kronecker product of every existing operator with each single-qubit Pauli
+        d = perms.shape[1]
+        perms = (perms[:, None, :, None] * 2 + PAULI_PERM[None, :, None, :]).reshape(4 * len(perms), 2 * d)
+        phases = (phases[:, None, :, None] * PAULI_PHASE[None, :, None, :]).reshape(4 * len(phases), 2 * d)
+    perms.flags.writeable = False
+    phases.flags.writeable = False
+    return perms, phases
+
+
 def get_p_table(U: np.ndarray, nn: int) -> np.ndarray:
     """Compute all p_U(x, y) values as a 4^n x 4^n table."""
-    labels = pauli_labels_for_n(nn)
-    num_labels = len(labels)
-    out = np.zeros((num_labels, num_labels))
-    for i, x in enumerate(labels):
-        for j, y in enumerate(labels):
-            out[i, j] = p_u(U, list(x), list(y))
-    return out
+    perms, phases = pauli_permutations(nn)
+    rows = np.arange(perms.shape[1])
+    U_dag = U.conj().T
+    # U P_y U† = (U scaled column-wise by P_y's phases) @ (U† with rows permuted by P_y), for every y
+    UPU = (U[None, :, :] * phases[:, None, :]) @ U_dag[perms]
+    # Tr(P_x A) = sum_i phase_x[i] * A[perm_x[i], i], gathered for every (y, x) at once
+    traces = np.einsum("xi,yxi->xy", phases, UPU[:, perms, rows])
+    # P_x and U P_y U† are both Hermitian, so every trace is real and |trace|^2 = Re(trace)^2
+    return (2 ** (-4 * nn)) * traces.real**2
 
 
 def p_acc_from_table(p_table: np.ndarray, nn: int) -> float:
@@ -64,7 +90,9 @@ def p_acc_from_table(p_table: np.ndarray, nn: int) -> float:
 
     p_acc = 2^(2n) * sum(p_U(x,y)^2)
     """
-    return float((2 ** (2 * nn)) * np.sum(p_table**2))
+    # Sum of squares as one dot product, without a squared temporary of the whole table
+    flat = p_table.ravel()
+    return float((2 ** (2 * nn)) * np.dot(flat, flat))
 
 
 def expected_acceptance_probability(U_matrix: np.ndarray, n: int) -> float:
@@ -5,8 +5,6 @@ from qiskit.providers import BackendV2
 from qiskit_aer import AerJob
 from qiskit_quantuminspire.qi_jobs import QIJob
 
-from .state import JOB_GLOB
-
 
 class JobManagementError(Exception):
     pass
@@ -41,12 +39,10 @@ def get_job_id(job: AerJob | QIJob) -> str:
 def save_job(job: AerJob | QIJob, checkpoint_dir: Path) -> None:
     """Serialize a job to checkpoint_dir if it supports serialization (QI jobs).
 
-    Saves as job_{id}.qpy. Removes any previous job_*.qpy first.
+    Saves as job_{id}.qpy. Several jobs can be outstanding at once, so other
+    job files are left alone; call ``remove_job`` once a job's counts are stored.
     """
     if isinstance(job, QIJob):
-        # Clean old serialized jobs
-        for old in checkpoint_dir.glob(JOB_GLOB):
-            old.unlink()
         jid = get_job_id(job)
         job.serialize(checkpoint_dir / f"job_{jid}.qpy")
     elif not isinstance(job, AerJob):
@@ -54,18 +50,22 @@ def save_job(job: AerJob | QIJob, checkpoint_dir: Path) -> None:
         raise JobManagementError(msg)
 
 
+def remove_job(checkpoint_dir: Path, job_id: str) -> None:
+    """Delete a job saved by ``save_job``, if there is one."""
+    (checkpoint_dir / f"job_{job_id}.qpy").unlink(missing_ok=True)
+
+
 def load_job(backend: BackendV2, checkpoint_dir: Path, job_id: str) -> QIJob | None:
     """Try to reconstruct a QI job from a serialized checkpoint.
 
     QIJob.deserialize() requires a provider just to call provider.get_backend(),
     but we already have the backend. So we reconstruct the job directly.
     """
-    job_path = checkpoint_dir / f"job_{job_id}.qpy"
-    if not job_path.exists():
+    try:
+        with open(checkpoint_dir / f"job_{job_id}.qpy", "rb") as f:
+            circuits = qpy.load(f)
+    except FileNotFoundError:
         return None
-
-    with open(job_path, "rb") as f:
-        circuits = qpy.load(f)
     if not circuits:
         return None
     batch_job_id = circuits[0].metadata.get("batch_job_id")
@@ -18,7 +18,6 @@ from .state import (
     BatchedRawResults,
     ExpectedAcceptanceProbability,
     PairedRawResults,
-    PairedSample,
     load_batched_raw,
     load_paired_raw,
     save_batched_raw,
@@ -91,7 +90,8 @@ def collect_results_for_unitary(
         raw_dicts = clifford_tester_paired_runs(
             U, n, shots=shots, backend=backend_instance, transpilation_function=transpile_fn, timeout=effective_timeout, checkpoint_dir=paired_dir
         )
-        paired_raw = PairedRawResults(samples=[PairedSample(**d) for d in raw_dicts])
+        # Validate the whole list in one pydantic-core call rather than constructing each sample in Python
+        paired_raw = PairedRawResults.model_validate({"samples": raw_dicts})
         save_paired_raw(paired_raw, paired_dir)
         print(f"[done] {backend}/paired: saved raw results")
 
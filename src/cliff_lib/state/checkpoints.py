@@ -1,10 +1,12 @@
-import json
 from collections import Counter
 from pathlib import Path
 
 from pydantic import BaseModel
+from pydantic.dataclasses import dataclass
+from pydantic_core import to_json
 
-from .utils import atomic_write, serialize_key
+from ..clifford_tester.utils import weyl_x_matrix
+from .utils import atomic_write, deserialize_key, serialize_key
 
 PLAN_FILE = "plan.json"
 JOBS_FILE = "jobs.json"
@@ -25,21 +27,26 @@ class PairedPlan(BaseModel):
         return cls(n=n, total_shots=total_shots, x_counts={serialize_key(x): count for x, count in counter.items()})
 
     def to_counter(self) -> Counter[tuple[int, ...]]:
-        return Counter({tuple(json.loads(k)): v for k, v in self.x_counts.items()})
+        return Counter({deserialize_key(k): v for k, v in self.x_counts.items()})
 
 
 class BatchedPlan(BaseModel):
+    # The batched tester always covers every x in F_2^{2n}, so only n is stored and the
+    # x list is regenerated on load (older plan files also carry an all_x list, which is ignored)
     type: str = "batched"
     n: int
     shots_per_x: int
-    all_x: list[list[int]]
 
     def to_tuples(self) -> list[tuple[int, ...]]:
-        return [tuple(x) for x in self.all_x]
+        return [tuple(x) for x in weyl_x_matrix(self.n).tolist()]
 
 
-class JobEntry(BaseModel):
+# One per x, so a slotted dataclass rather than a BaseModel (see PairedSample)
+@dataclass(slots=True)
+class JobEntry:
     job_id: str | None = None
+    # Position of this x's circuit within a multi-circuit job (None for single-circuit jobs)
+    circuit_index: int | None = None
     counts: dict[str, int] | None = None
 
 
@@ -56,16 +63,21 @@ class JobsState(BaseModel):
 # --- Save / Load ---
 
 
+# Checkpoint files are transient machine state (deleted once a run completes), so they are
+# written compactly, as bytes straight from pydantic-core; results files in outputs.py stay
+# indented for reading and diffing
+
+
 def save_plan(plan: PairedPlan | BatchedPlan, path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
-    atomic_write(path / PLAN_FILE, plan.model_dump_json(indent=2))
+    atomic_write(path / PLAN_FILE, to_json(plan))
 
 
 def load_paired_plan(path: Path) -> PairedPlan | None:
     filepath = path / PLAN_FILE
     if not filepath.exists():
         return None
-    plan = PairedPlan.model_validate_json(filepath.read_text())
+    plan = PairedPlan.model_validate_json(filepath.read_bytes())
     if plan.type != "paired_runs":
         raise ValueError(f"Expected paired_runs plan, got {plan.type}")
     return plan
@@ -75,7 +87,7 @@ def load_batched_plan(path: Path) -> BatchedPlan | None:
     filepath = path / PLAN_FILE
     if not filepath.exists():
         return None
-    plan = BatchedPlan.model_validate_json(filepath.read_text())
+    plan = BatchedPlan.model_validate_json(filepath.read_bytes())
     if plan.type != "batched":
         raise ValueError(f"Expected batched plan, got {plan.type}")
     return plan
@@ -83,14 +95,14 @@ def load_batched_plan(path: Path) -> BatchedPlan | None:
 
 def save_jobs(state: JobsState, path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
-    atomic_write(path / JOBS_FILE, state.model_dump_json(indent=2))
+    atomic_write(path / JOBS_FILE, to_json(state))
 
 
 def load_jobs(path: Path) -> JobsState | None:
     filepath = path / JOBS_FILE
     if not filepath.exists():
         return None
-    return JobsState.model_validate_json(filepath.read_text())
+    return JobsState.model_validate_json(filepath.read_bytes())
 
 
 def cleanup_checkpoint(path: Path) -> None:
@@ -1,9 +1,11 @@
-import json
 from pathlib import Path
 
 from pydantic import BaseModel
+from pydantic.dataclasses import dataclass
+from pydantic_core import to_json
 
-from ..clifford_tester.utils import collision_probability
+from ..clifford_tester.utils import mean_collision_probability
+from .utils import deserialize_key, serialize_key
 
 PAIRED_RAW_RESULTS_FILE = "raw_results.json"
 BATCHED_RAW_RESULTS_FILE = "raw_results.json"
@@ -13,7 +15,10 @@ SUMMARY_FILE = "summary.json"
 # --- Models ---
 
 
-class PairedSample(BaseModel):
+# A slotted dataclass rather than a BaseModel: there is one of these per shot pair,
+# and dropping the per-instance __dict__ keeps large paired results small in memory
+@dataclass(slots=True, frozen=True)
+class PairedSample:
     x: list[int]
     y1: str
     y2: str
@@ -35,19 +40,16 @@ class BatchedRawResults(BaseModel):
 
     def summarise(self) -> float:
         """Compute average collision probability across all Weyl operators."""
-        if not self.counts_by_x:
-            return 0.0
-        total = sum(collision_probability(counts) for counts in self.counts_by_x.values())
-        return total / len(self.counts_by_x)
+        return mean_collision_probability(list(self.counts_by_x.values()))
 
     def to_tuples(self) -> dict[tuple[int, ...], dict[str, int]]:
         """Convert back to the dict[tuple, dict] format."""
-        return {tuple(json.loads(k)): v for k, v in self.counts_by_x.items()}
+        return {deserialize_key(k): v for k, v in self.counts_by_x.items()}
 
     @classmethod
     def from_tuples(cls, results: dict[tuple[int, ...], dict[str, int]]) -> "BatchedRawResults":
         """Convert from the dict[tuple, dict] returned by the tester."""
-        return cls(counts_by_x={json.dumps(k): v for k, v in results.items()})
+        return cls(counts_by_x={serialize_key(k): v for k, v in results.items()})
 
 
 class Summary(BaseModel):
@@ -60,29 +62,32 @@ class ExpectedAcceptanceProbability(BaseModel):
 
 # --- Save / Load ---
 
+# Raw results can be large, so they are written and parsed as bytes straight
+# from pydantic-core's Rust JSON encoder/decoder, skipping the str round-trip
+
 
 def save_paired_raw(results: PairedRawResults, path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
-    (path / PAIRED_RAW_RESULTS_FILE).write_text(results.model_dump_json(indent=2))
+    (path / PAIRED_RAW_RESULTS_FILE).write_bytes(to_json(results, indent=2))
 
 
 def load_paired_raw(path: Path) -> PairedRawResults | None:
     filepath = path / PAIRED_RAW_RESULTS_FILE
     if not filepath.exists():
         return None
-    return PairedRawResults.model_validate_json(filepath.read_text())
+    return PairedRawResults.model_validate_json(filepath.read_bytes())
 
 
 def save_batched_raw(results: BatchedRawResults, path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
-    (path / BATCHED_RAW_RESULTS_FILE).write_text(results.model_dump_json(indent=2))
+    (path / BATCHED_RAW_RESULTS_FILE).write_bytes(to_json(results, indent=2))
 
 
 def load_batched_raw(path: Path) -> BatchedRawResults | None:
     filepath = path / BATCHED_RAW_RESULTS_FILE
     if not filepath.exists():
         return None
-    return BatchedRawResults.model_validate_json(filepath.read_text())
+    return BatchedRawResults.model_validate_json(filepath.read_bytes())
 
 
 def save_summary(acceptance_rate: float, path: Path) -> None:
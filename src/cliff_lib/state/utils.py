@@ -7,10 +7,30 @@ def serialize_key(x: tuple[int, ...]) -> str:
     return json.dumps(list(x))
 
 
-def atomic_write(path: Path, content: str) -> None:
+def deserialize_key(key: str) -> tuple[int, ...]:
+    """Inverse of serialize_key.
+
+    Parses the fixed "[0, 1, ...]" layout directly rather than going through
+    a general parser, and raises ValueError for anything else.
+    """
+    if not (key.startswith("[") and key.endswith("]")):
+        raise ValueError(f"Invalid x key {key!r}, expected a JSON list like '[0, 1]'")
+    inner = key[1:-1]
+    if not inner.strip():
+        return ()
+    return tuple(int(v) for v in inner.split(","))
+
+
+def atomic_write(path: Path, content: str | bytes) -> None:
+    """Replace path with content via a fsynced temporary file. Bytes are written as-is; str is UTF-8 encoded."""
+    data = content.encode() if isinstance(content, str) else content
     tmp = path.with_name(path.name + ".tmp")
     try:
-        tmp.write_text(content)
+        with tmp.open("wb") as f:
+            f.write(data)
+            f.flush()
+            # Make sure the data is on disk before the rename, so a crash can't leave an empty checkpoint behind
+            os.fsync(f.fileno())
         os.replace(tmp, path)
     except BaseException:
         tmp.unlink(missing_ok=True)
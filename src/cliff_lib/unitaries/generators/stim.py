@@ -12,8 +12,10 @@ def stim_random_clifford_gate(n: int) -> UnitaryGate:
     The endian='little' parameter matches Qiskit's qubit ordering convention.
     """
     tab = stim.Tableau.random(n)
-    unitary = tab.to_unitary_matrix(endian="little").astype(np.complex128)
-    return UnitaryGate(unitary)
+    # Stim currently returns complex64, so this still converts, but it won't copy if that changes
+    unitary = tab.to_unitary_matrix(endian="little").astype(np.complex128, copy=False)
+    # A Stim tableau is a Clifford by construction, so skip Qiskit's unitarity check
+    return UnitaryGate(unitary, check_input=False)
 
 
 def freeze_stim_clifford(n: int) -> str:
@@ -0,0 +1,40 @@
+from itertools import product
+
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import Statevector
+
+from cliff_lib.backends import default_transpilation_function
+from cliff_lib.clifford_tester.utils import get_clifford_tester_circuit, get_clifford_tester_template, weyl_x_matrix
+
+
+class TestWeylXMatrix:
+    """Tests for the F_2^{2n} enumeration used by the batched tester."""
+
+    def test_matches_itertools_product_order(self):
+        for n in (1, 2, 3):
+            expected = list(product([0, 1], repeat=2 * n))
+            assert [tuple(row) for row in weyl_x_matrix(n).tolist()] == expected
+
+    def test_shape_and_dtype(self):
+        bits = weyl_x_matrix(2)
+        assert bits.shape == (16, 4)
+        assert bits.dtype == np.uint8
+
+
+class TestCliffordTesterTemplate:
+    """The parameterised template must reproduce every per-x tester circuit."""
+
+    def test_bound_template_matches_per_x_circuit(self):
+        n = 2
+        U = QuantumCircuit(n)
+        U.h(0)
+        U.t(0)
+        U.cx(0, 1)
+        template, weyl_bits = get_clifford_tester_template(U, n)
+        transpiled = default_transpilation_function(template)
+
+        for x in product([0, 1], repeat=2 * n):
+            expected = default_transpilation_function(get_clifford_tester_circuit(U, n, x)).remove_final_measurements(inplace=False)
+            bound = transpiled.assign_parameters(dict(zip(weyl_bits, x, strict=True))).remove_final_measurements(inplace=False)
+            np.testing.assert_allclose(Statevector(bound).probabilities(), Statevector(expected).probabilities(), atol=1e-12)
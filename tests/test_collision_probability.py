@@ -0,0 +1,43 @@
+import pytest
+
+from cliff_lib.clifford_tester.utils import collision_probability, mean_collision_probability
+from cliff_lib.state import BatchedRawResults
+
+
+class TestCollisionProbability:
+    """Collision probability is Σᵢ (count_i / total)²."""
+
+    def test_single_outcome(self):
+        assert collision_probability({"00": 1000}) == pytest.approx(1.0)
+
+    def test_uniform_over_four_outcomes(self):
+        assert collision_probability({"00": 250, "01": 250, "10": 250, "11": 250}) == pytest.approx(0.25)
+
+    def test_uneven_split(self):
+        # (3/4)² + (1/4)² = 10/16
+        assert collision_probability({"0": 75, "1": 25}) == pytest.approx(0.625)
+
+    def test_empty_counts(self):
+        assert collision_probability({}) == 0.0
+
+
+class TestMeanCollisionProbability:
+    """The vectorised mean must match averaging collision_probability one dict at a time."""
+
+    def test_matches_per_dict_mean(self):
+        counts_list = [{"00": 1000}, {"0": 75, "1": 25}, {"00": 250, "01": 250, "10": 250, "11": 250}]
+        assert mean_collision_probability(counts_list) == pytest.approx((1.0 + 0.625 + 0.25) / 3)
+
+    def test_with_empty_dict(self):
+        assert mean_collision_probability([{"0": 10}, {}]) == pytest.approx(0.5)
+
+    def test_no_dicts(self):
+        assert mean_collision_probability([]) == 0.0
+
+
+class TestBatchedSummarise:
+    """BatchedRawResults.summarise averages collision probability over Weyl operators."""
+
+    def test_averages_over_weyl_operators(self):
+        results = BatchedRawResults(counts_by_x={"[0, 0]": {"00": 500, "11": 500}, "[0, 1]": {"01": 750, "10": 250}})
+        assert results.summarise() == pytest.approx((0.5 + 0.625) / 2)
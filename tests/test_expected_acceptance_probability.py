@@ -6,6 +6,8 @@ from cliff_lib.expected_acceptance_probability import (
     expected_acceptance_probability,
     expected_acceptance_probability_from_circuit,
     get_p_table,
+    p_u,
+    pauli_labels_for_n,
 )
 
 # Common gate matrices
@@ -42,6 +44,12 @@ class TestProbabilityTableProperties:
         table = get_p_table(HADAMARD, 1)
         assert (table >= 0).all()
 
+    def test_table_matches_pointwise_p_u(self):
+        """The vectorised table must agree with p_u evaluated at every (x, y)."""
+        labels = pauli_labels_for_n(3)
+        expected = np.array([[p_u(TOFFOLI, list(x), list(y)) for y in labels] for x in labels])
+        np.testing.assert_allclose(get_p_table(TOFFOLI, 3), expected, atol=1e-12)
+
 
 class TestCliffordGatesAcceptWithProbabilityOne:
     """Clifford gates must have acceptance probability exactly 1.0."""
@@ -0,0 +1,19 @@
+from itertools import product
+
+import pytest
+
+from cliff_lib.state.utils import deserialize_key, serialize_key
+
+
+class TestKeyRoundTrip:
+    """deserialize_key must invert serialize_key for every x the testers produce."""
+
+    def test_round_trip(self):
+        for length in (0, 1, 2, 4):
+            for x in product([0, 1], repeat=length):
+                assert deserialize_key(serialize_key(x)) == x
+
+    def test_rejects_malformed_keys(self):
+        for key in ("(0, 1)", "(1,)", "0, 1", "[0, 1", "[1,]", "[a]", ""):
+            with pytest.raises(ValueError):
+                deserialize_key(key)
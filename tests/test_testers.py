@@ -0,0 +1,81 @@
+from collections import Counter
+from types import SimpleNamespace
+
+from qiskit import QuantumCircuit
+from qiskit_aer import AerSimulator
+from qiskit_aer.noise import NoiseModel, depolarizing_error
+
+from cliff_lib.backends import default_transpilation_function
+from cliff_lib.clifford_tester.testers import _can_use_template, clifford_tester_batched, clifford_tester_paired_runs
+from cliff_lib.state import PairedPlan, save_plan
+
+
+class CappedBackend:
+    """
+    AerSimulator stand-in that enforces a QI-style batch job limit.
+
+    Like QIBackend, it reports max_circuits as None and exposes the real limit
+    through get_backend_type().max_jobs_per_batch_job, rejecting larger jobs at submission.
+    """
+
+    max_circuits = None
+
+    def __init__(self, max_jobs_per_batch_job: int):
+        self._simulator = AerSimulator()
+        self._max_jobs_per_batch_job = max_jobs_per_batch_job
+        self.job_sizes: list[int] = []
+
+    def get_backend_type(self) -> SimpleNamespace:
+        return SimpleNamespace(max_jobs_per_batch_job=self._max_jobs_per_batch_job)
+
+    def run(self, circuits: list[QuantumCircuit], **options):
+        if len(circuits) > self._max_jobs_per_batch_job:
+            raise ValueError(f"{len(circuits)} circuits submitted, limit is {self._max_jobs_per_batch_job}")
+        self.job_sizes.append(len(circuits))
+        return self._simulator.run(circuits, **options)
+
+
+def _hadamard() -> QuantumCircuit:
+    qc = QuantumCircuit(1)
+    qc.h(0)
+    return qc
+
+
+class TestJobSizeLimit:
+    """Testers must split their multi-circuit jobs to the backend's batch job limit."""
+
+    def test_batched_splits_to_limit(self, tmp_path):
+        backend = CappedBackend(max_jobs_per_batch_job=3)
+        results = clifford_tester_batched(
+            _hadamard(), 1, shots=10, backend=backend, transpilation_function=default_transpilation_function, checkpoint_dir=tmp_path
+        )
+        assert backend.job_sizes == [3, 1]
+        assert len(results) == 4
+
+    def test_paired_splits_to_limit(self, tmp_path):
+        # A saved plan with one shot per x puts all four x in the same shot-count group
+        save_plan(PairedPlan.from_counter(1, 4, Counter({(0, 0): 1, (0, 1): 1, (1, 0): 1, (1, 1): 1})), tmp_path)
+        backend = CappedBackend(max_jobs_per_batch_job=3)
+        results = clifford_tester_paired_runs(
+            _hadamard(), 1, shots=4, backend=backend, transpilation_function=default_transpilation_function, checkpoint_dir=tmp_path
+        )
+        assert backend.job_sizes == [3, 1]
+        assert len(results) == 4
+
+
+class TestCanUseTemplate:
+    """The parameterised template is only used where its identity rotations are free."""
+
+    def test_noiseless_aer_with_default_transpilation(self):
+        assert _can_use_template(AerSimulator(), default_transpilation_function)
+
+    def test_noisy_aer(self):
+        noise_model = NoiseModel()
+        noise_model.add_all_qubit_quantum_error(depolarizing_error(0.01, 1), ["rz", "rx"])
+        assert not _can_use_template(AerSimulator(noise_model=noise_model), default_transpilation_function)
+
+    def test_custom_transpilation_function(self):
+        assert not _can_use_template(AerSimulator(), lambda qc: qc)
+
+    def test_non_aer_backend(self):
+        assert not _can_use_template(CappedBackend(max_jobs_per_batch_job=3), default_transpilation_function)
@@ -0,0 +1,55 @@
+import os
+from functools import partial
+
+import pytest
+from qiskit import QuantumCircuit
+from qiskit.providers.fake_provider import GenericBackendV2
+
+from cliff_lib.backends import _TUNA_9_QUBIT_PRIORITIES, _transpile_for_target
+from cliff_lib.clifford_tester import testers
+from cliff_lib.clifford_tester.testers import _PARALLEL_TRANSPILE_MIN_CIRCUITS, _transpile_all
+
+
+def _tag_with_pid(qc: QuantumCircuit) -> QuantumCircuit:
+    """Stand-in transpilation function that records which process ran it."""
+    tagged = qc.copy()
+    tagged.metadata = {**qc.metadata, "pid": os.getpid()}
+    return tagged
+
+
+def _circuits(count: int) -> list[QuantumCircuit]:
+    return [QuantumCircuit(1, metadata={"index": i}) for i in range(count)]
+
+
+@pytest.fixture
+def two_cores(monkeypatch):
+    monkeypatch.setattr(testers, "_worker_count", lambda: 2)
+
+
+class TestTranspileAll:
+    """_transpile_all maps the transpilation function over a process pool only when it can and should."""
+
+    def test_large_batch_goes_through_pool(self, two_cores):
+        out = _transpile_all(_circuits(_PARALLEL_TRANSPILE_MIN_CIRCUITS), _tag_with_pid)
+        assert [qc.metadata["index"] for qc in out] == list(range(_PARALLEL_TRANSPILE_MIN_CIRCUITS))
+        assert all(qc.metadata["pid"] != os.getpid() for qc in out)
+
+    def test_small_batch_runs_serially(self, two_cores):
+        out = _transpile_all(_circuits(_PARALLEL_TRANSPILE_MIN_CIRCUITS - 1), _tag_with_pid)
+        assert all(qc.metadata["pid"] == os.getpid() for qc in out)
+
+    def test_unpicklable_function_runs_serially(self, two_cores):
+        out = _transpile_all(_circuits(_PARALLEL_TRANSPILE_MIN_CIRCUITS), lambda qc: _tag_with_pid(qc))
+        assert all(qc.metadata["pid"] == os.getpid() for qc in out)
+
+    def test_target_bound_transpilation_through_pool(self, two_cores):
+        # The QI transpilation function is a partial over the backend's Target, so workers need no QI connection
+        fn = partial(_transpile_for_target, GenericBackendV2(9).target, _TUNA_9_QUBIT_PRIORITIES)
+        circuits = []
+        for _ in range(_PARALLEL_TRANSPILE_MIN_CIRCUITS):
+            qc = QuantumCircuit(2)
+            qc.h(0)
+            qc.cx(0, 1)
+            circuits.append(qc)
+        out = _transpile_all(circuits, fn)
+        assert all(qc.layout.initial_index_layout()[:2] == [4, 1] for qc in out)
@@ -9,4 +9,4 @@ class QuantumGateMatrixTest:
     def assert_gate_matrix_equal(self, gate: Gate, expected: np.ndarray):
         """Assert that a gate's matrix representation matches the expected matrix."""
         actual = Operator(gate).data
-        np.testing.assert_array_almost_equal(actual, expected)
+        np.testing.assert_allclose(actual, expected, rtol=0, atol=1e-6)